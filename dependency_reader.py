@@ -15,7 +15,7 @@ LANG_FILE_PATH = "data/project_languages.json"
 def fetch_description_pypi(package_name):
     """Fetches the package description from PyPI (Python Package Index)."""
     url = f"https://pypi.org/pypi/{package_name}/json"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         return data["info"]["summary"] + "\n\n" + data["info"]["description"] if data["info"]["summary"] else "-"
@@ -24,7 +24,7 @@ def fetch_description_pypi(package_name):
 def fetch_description_npm(package_name):
     """Fetches the package description from npm (package manager for JavaScript)."""
     url = f"https://registry.npmjs.org/{package_name}"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         latest_version = data["dist-tags"]["latest"]
@@ -34,7 +34,7 @@ def fetch_description_npm(package_name):
 def fetch_description_rubygems(gem_name):
     """Fetches the gem description from RubyGems (package manager for Ruby)."""
     url = f"https://rubygems.org/api/v1/gems/{gem_name}.json"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         return data["info"] if data["info"] else "-"
@@ -43,7 +43,7 @@ def fetch_description_rubygems(gem_name):
 def fetch_description_maven(group_id, artifact_id):
     """Fetches package description from Maven Central (Java packages)."""
     url = f'https://search.maven.org/solrsearch/select?q=g:"{group_id}"+AND+a:"{artifact_id}"&rows=1&wt=json'
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         docs = data["response"]["docs"]
@@ -53,12 +53,12 @@ def fetch_description_maven(group_id, artifact_id):
 def fetch_description_nuget(package_name):
     """Fetches package description from NuGet (package manager for .NET)."""
     url = f"https://api.nuget.org/v3/registration5-semver1/{package_name}/index.json"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         latest_version = data["items"][0]["upper"]
         url_version = f"https://api.nuget.org/v3/registration5-semver1/{package_name}/{latest_version}.json"
-        response_version = requests.get(url_version)
+        response_version = requests.get(url_version, timeout=5)
         if response_version.status_code == 200:
             data_version = response_version.json()
             return data_version["items"][0]["catalogEntry"]["description"] if data_version["items"][0]["catalogEntry"]["description"] else "-"
@@ -66,7 +66,7 @@ def fetch_description_nuget(package_name):
 def fetch_description_go(package_name):
     """Fetches package description from the Go module proxy."""
     url = f"https://proxy.golang.org/{package_name}/@latest"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         return data.get("Description", "-")
@@ -76,7 +76,7 @@ def fetch_description_go(package_name):
 def fetch_description_crates(package_name):
     """Fetches package description from crates.io (Rust packages)."""
     url = f"https://crates.io/api/v1/crates/{package_name}"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         return data["crate"]["description"] if data["crate"]["description"] else "-"
@@ -84,7 +84,7 @@ def fetch_description_crates(package_name):
 def fetch_description_packagist(package_name):
     """Fetches package description from Packagist (PHP packages)."""
     url = f"https://repo.packagist.org/p2/{package_name}.json"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         latest_version = list(data["packages"][package_name].keys())[0]
@@ -94,7 +94,7 @@ def fetch_description_packagist(package_name):
 
 def fetch_description_debian(package_name):
     url = f"https://packages.debian.org/sid/{package_name}"
-    response = requests.get(url)
+    response = requests.get(url, timeout=5)
     if response.status_code == 200:
         soup = BeautifulSoup(response.content, 'html.parser')
         description_div = soup.find('div', id='pdesc')
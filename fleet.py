@@ -0,0 +1,176 @@
+import os
+import json
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from tqdm import tqdm
+
+from parse_images import parse_image_names
+from image_hierarchy import get_base_image, get_image_sbom, write_image_hierarchy_to_file
+from image_info import get_image_info, write_image_info_to_file
+from syft_check import scan_with_syft
+from dependency_reader import get_package_description, write_descriptions_to_file
+from stig_parser import (
+    load_data_from_json,
+    process_dependency_descriptions,
+    process_image_descriptions,
+    process_project_languages,
+    write_used_stigs_to_file,
+)
+
+
+def run_safely(key, func, *args):
+    """Runs func(*args), logging any failure against key so that it only affects that key."""
+    try:
+        return func(*args)
+    except Exception as e:
+        print(f"An error occurred for {key}: {str(e)}")
+        return None
+
+
+def load_artifacts(output):
+    return json.loads(output).get("artifacts", []) if output else []
+
+
+def scan_project(repo):
+    """Returns the Syft artifacts of a repo checkout, as syft_check does for the current directory."""
+    return load_artifacts(scan_with_syft(f"dir:{repo}"))
+
+
+def scan_image(image):
+    """Returns the Docker Scout SBOM artifacts of an image, as image_hierarchy does."""
+    return load_artifacts(get_image_sbom(image))
+
+
+def artifact_key(artifact):
+    """Identifies a package independently of its version and of the source it was found in."""
+    language = artifact.get("language") or artifact.get("type")
+    purl = (artifact.get("purl") or "").split("@")[0]
+    return language, artifact.get("name"), purl
+
+
+def build_hierarchy(image_name, base_images):
+    """Walks the resolved base images from image_name up to the root image."""
+    hierarchy = [image_name]
+    base_image = base_images.get(image_name)
+    while base_image and base_image not in hierarchy:
+        hierarchy.append(base_image)
+        base_image = base_images.get(base_image)
+    return hierarchy
+
+
+def analyse_fleet(pool, repo_images, repos):
+    """Runs every unique lookup once on the shared pool, submitting work as soon as its input is known."""
+    results = defaultdict(dict)
+    packages = set()
+    pending = {}
+    seen_images = set()
+    progress = tqdm(total=0, desc="Analysing fleet")
+
+    def submit(kind, key, func, *args):
+        pending[pool.submit(run_safely, key, func, *args)] = (kind, key)
+        progress.total += 1
+        progress.refresh()
+
+    def submit_image(image):
+        if image not in seen_images:
+            seen_images.add(image)
+            submit("base", image, get_base_image, image)
+            submit("details", image, get_image_info, image)
+            submit("sbom", image, scan_image, image)
+
+    for repo in repos:
+        submit("project", repo, scan_project, repo)
+    for images in repo_images.values():
+        for image in images:
+            submit_image(image)
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            kind, key = pending.pop(future)
+            result = future.result()
+            results[kind][key] = result
+            progress.update(1)
+            if kind == "base" and result:
+                submit_image(result)
+            elif kind in ("sbom", "project"):
+                for artifact in result or []:
+                    package = artifact_key(artifact)
+                    if package not in packages:
+                        packages.add(package)
+                        submit("description", package, get_package_description, artifact)
+    progress.close()
+    return results
+
+
+def split_repo_results(initial_images, project_artifacts, results):
+    """Picks out one repo's images and package descriptions from the shared fleet results."""
+    images = {image for initial in initial_images for image in build_hierarchy(initial, results["base"])}
+    repo_artifacts = list(project_artifacts or [])
+    for image in images:
+        repo_artifacts.extend(results["sbom"].get(image) or [])
+
+    package_descriptions = defaultdict(set)
+    for package in {artifact_key(artifact) for artifact in repo_artifacts}:
+        if results["description"].get(package):
+            language, description, package_name = results["description"][package]
+            if description:
+                package_descriptions[language].add((package_name, description))
+    return images, package_descriptions
+
+
+def write_repo_results(repo, images, image_details, package_descriptions, stig_schema):
+    """Writes the per-repo data files and used_stigs.json from the shared fleet results."""
+    data_dir = os.path.join(repo, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    dependency_file = os.path.join(data_dir, "dependency_descriptions.json")
+    image_details_file = os.path.join(data_dir, "image_details.json")
+
+    write_image_hierarchy_to_file(sorted(images), os.path.join(data_dir, "docker_images.json"))
+    write_image_info_to_file({image: image_details[image] for image in images if image_details.get(image)}, image_details_file)
+    write_descriptions_to_file(dependency_file, package_descriptions)
+
+    used_stigs = process_dependency_descriptions(dependency_file, stig_schema)
+    used_stigs.update(process_image_descriptions(image_details_file, stig_schema))
+    used_stigs.update(process_project_languages(stig_schema, dependency_file))
+    write_used_stigs_to_file(used_stigs, os.path.join(data_dir, "used_stigs.json"))
+
+
+def run_fleet(repos, stig_file, workers):
+    """Analyses many repo checkouts, scanning each unique image and package only once."""
+    stig_schema = load_data_from_json(stig_file)
+    repo_images = {}
+    for repo in repos:
+        images = run_safely(repo, parse_image_names, repo)
+        if images is None:
+            print(f"Skipping {repo}: its Docker and Docker Compose files could not be parsed")
+        else:
+            repo_images[repo] = images
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = analyse_fleet(pool, repo_images, list(repo_images))
+
+    for repo, initial_images in repo_images.items():
+        try:
+            images, package_descriptions = split_repo_results(initial_images, results["project"].get(repo), results)
+            write_repo_results(repo, images, results["details"], package_descriptions, stig_schema)
+            print(f"{repo}: {len(images)} images, {sum(map(len, package_descriptions.values()))} described dependencies")
+        except Exception as e:
+            print(f"Failed to write results for {repo}: {str(e)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the analysis over many repository checkouts at once.")
+    parser.add_argument("repos", nargs="+", help="paths to repository checkouts")
+    parser.add_argument("--stig", default="stig.json", help="path to the STIG schema")
+    parser.add_argument("--workers", type=int, default=16, help="size of the shared worker pool")
+    args = parser.parse_args()
+    missing = [repo for repo in args.repos if not os.path.isdir(repo)]
+    if missing:
+        parser.error(f"not a repository checkout: {', '.join(missing)}")
+    run_fleet(args.repos, args.stig, args.workers)
+
+
+if __name__ == "__main__":
+    main()
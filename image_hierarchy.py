@@ -61,28 +61,36 @@ def read_image_names_from_file(file_path):
         return json.load(file)
 
 
-def write_image_hierarchy_to_file(image_hierarchy):
-    with open("data/docker_images.json", "w") as f:
+def write_image_hierarchy_to_file(image_hierarchy, file_path="data/docker_images.json"):
+    with open(file_path, "w") as f:
         json.dump(image_hierarchy, f, indent=4)
 
 
+def get_image_sbom(image):
+    """Returns the Docker Scout SBOM of an image as JSON text, or None on failure."""
+    try:
+        # Run the Docker Scout command
+        result = subprocess.run(
+            ["docker", "scout", "sbom", "--format", "json", image],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        print(f"Failed to run Docker Scout on {image}: {str(e)}")
+        return None
+
+
 def get_image_dependencies(image_names):
     for image in tqdm(image_names, desc="Obtaining image dependencies"):
         image_name = image.replace("/", "_").replace(":", "_")
         output_file = f"data/docker_dependency_{image_name}.json"
-        try:
-            # Run the Docker Scout command
-            result = subprocess.run(
-                ["docker", "scout", "sbom", "--format", "json", image],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        output = get_image_sbom(image)
+        if output is not None:
             # Write the output to a file
             with open(output_file, "w") as f:
-                f.write(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to run Docker Scout on {image}: {str(e)}")
+                f.write(output)
             
 def write_base_images_to_file(base_images):
     with open("data/base_images.json", "w") as f:
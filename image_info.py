@@ -50,8 +50,8 @@ def fetch_image_info(docker_image_names):
 
     return image_details
 
-def write_image_info_to_file(image_details):
-    with open('data/image_details.json', 'w') as f:
+def write_image_info_to_file(image_details, file_path='data/image_details.json'):
+    with open(file_path, 'w') as f:
         json.dump(image_details, f, indent=4)
 
 def read_image_names_from_file(file_path):
@@ -1,16 +1,17 @@
 import glob
+import os
 from dockerfile_parse import DockerfileParser
 import yaml
 import re
 import json
 
-def find_dockerfiles():
-    """Finds Dockerfiles in the current directory and subdirectories."""
-    return glob.glob('**/Dockerfile', recursive=True)
+def find_dockerfiles(root=''):
+    """Finds Dockerfiles in the given directory (current by default) and subdirectories."""
+    return [os.path.join(root, path) for path in glob.glob('**/Dockerfile', root_dir=root or None, recursive=True)]
 
-def find_docker_compose_files():
-    """Finds Docker Compose files in the current directory and subdirectories."""
-    return glob.glob('**/docker-compose*.yml', recursive=True)
+def find_docker_compose_files(root=''):
+    """Finds Docker Compose files in the given directory (current by default) and subdirectories."""
+    return [os.path.join(root, path) for path in glob.glob('**/docker-compose*.yml', root_dir=root or None, recursive=True)]
 
 def parse_dockerfile_images(dockerfiles):
     """Parses Dockerfiles to extract image names."""
@@ -50,10 +51,10 @@ def parse_docker_compose_images(docker_compose_files):
     return images
 
 
-def parse_image_names():
+def parse_image_names(root=''):
     """Fetches and displays information for images found in Docker and Docker Compose files."""
-    dockerfiles = find_dockerfiles()
-    docker_compose_files = find_docker_compose_files()
+    dockerfiles = find_dockerfiles(root)
+    docker_compose_files = find_docker_compose_files(root)
 
     dockerfile_images = parse_dockerfile_images(dockerfiles)
     docker_compose_images = parse_docker_compose_images(docker_compose_files)
@@ -61,7 +61,10 @@ def read_dependency_descriptions(file_path):
             if not packages:
                 yield None, None, language
             for package in packages:
-                name, description = package
+                if isinstance(package, dict):
+                    name, description = package["name"], package["description"]
+                else:
+                    name, description = package
                 yield name, description, language
 
 
@@ -97,8 +100,7 @@ def process_image_descriptions(file_path, stig_schema):
     return used_stigs
 
 
-def process_project_languages(stig_schema):
-    language_file = "data/dependency_descriptions.json"
+def process_project_languages(stig_schema, language_file="data/dependency_descriptions.json"):
     used_stigs = defaultdict(list)
     with open(language_file, "r") as file:
         data = json.load(file)
@@ -110,9 +112,9 @@ def process_project_languages(stig_schema):
     return used_stigs
 
 
-def write_used_stigs_to_file(used_stigs):
+def write_used_stigs_to_file(used_stigs, file_path="data/used_stigs.json"):
     """Write the used STIGs to a file."""
-    with open("data/used_stigs.json", "w") as file:
+    with open(file_path, "w") as file:
         json.dump(used_stigs, file, indent=2)
 
 
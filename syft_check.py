@@ -10,9 +10,17 @@ def run_syft(image):
     result = subprocess.run(['syft', image, '-o', 'json'], capture_output=True, text=True, check=True)
     return result.stdout.strip()
 
-def run_syft_on_directory():
-    result = subprocess.run(['syft', 'dir:.', '-o', 'json'], capture_output=True, text=True, check=True)
-    return result.stdout.strip()
+def scan_with_syft(source):
+    """Runs Syft on an image or dir: source, returning its JSON output or None on failure."""
+    try:
+        output = run_syft(source)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        print(f"Failed to run Syft on {source}: {str(e)}")
+        return None
+    if not output:
+        print(f"No output from Syft for {source}")
+        return None
+    return output
 
 def write_output(output, output_file):
     with open(output_file, 'w') as file:
@@ -24,26 +32,15 @@ def run_syft_on_images(image_file):
     for image in tqdm.tqdm(images, desc="Obtaining image dependencies"):
         image_name = image.replace('/', '_').replace(':', '_')
         output_file = f'data/docker_dependency_{image_name}.json'
-        try:
-            output = run_syft(image)
-            if output:
-                write_output(output, output_file)
-            else:
-                print(f"No output from Syft for {image}")
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to run Syft on {image}: {str(e)}")
+        output = scan_with_syft(image)
+        if output:
+            write_output(output, output_file)
 
 def run_syft_on_project():
     output_file = 'data/project_dependencies.json'
-    try:
-        output = run_syft_on_directory()
-        if output:
-            write_output(output, output_file)
-            # print(f"Syft analysis complete for current directory, results saved to {output_file}")
-        else:
-            print(f"No output from Syft for current directory")
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to run Syft on current directory: {str(e)}")
+    output = scan_with_syft('dir:.')
+    if output:
+        write_output(output, output_file)
 
 if __name__ == "__main__":
     # run_syft_on_images('data/docker_images.json')
@@ -0,0 +1,77 @@
+import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import fleet
+
+
+def test_artifact_key_ignores_version():
+    old = {"name": "requests", "language": "python", "purl": "pkg:pypi/requests@2.30.0"}
+    new = {"name": "requests", "language": "python", "purl": "pkg:pypi/requests@2.31.0"}
+    assert fleet.artifact_key(old) == fleet.artifact_key(new)
+
+
+def test_artifact_key_falls_back_to_type():
+    artifact = {"name": "openssl", "type": "deb"}
+    assert fleet.artifact_key(artifact) == ("deb", "openssl", "")
+
+
+def test_build_hierarchy_stops_on_cycle():
+    base_images = {"app:1": "python:3.12", "python:3.12": "debian:12", "debian:12": "app:1"}
+    assert fleet.build_hierarchy("app:1", base_images) == ["app:1", "python:3.12", "debian:12"]
+
+
+def test_analyse_fleet_looks_up_shared_inputs_once(monkeypatch, tmp_path):
+    calls = Counter()
+
+    def get_base_image(image):
+        calls["base"] += 1
+        return {"python:3.12": "debian:12", "nginx:1.25": "debian:12"}.get(image)
+
+    def scan_image(image):
+        calls["sbom"] += 1
+        package = "python3" if image == "python:3.12" else "openssl"
+        return [{"name": package, "type": "deb", "purl": f"pkg:deb/{package}@{image}"}]
+
+    def get_package_description(artifact):
+        calls["description"] += 1
+        return "deb", f"{artifact['name']} description", artifact["name"]
+
+    monkeypatch.setattr(fleet, "get_base_image", get_base_image)
+    monkeypatch.setattr(fleet, "get_image_info", lambda image: {"name": image})
+    monkeypatch.setattr(fleet, "scan_image", scan_image)
+    monkeypatch.setattr(fleet, "scan_project", lambda repo: [])
+    monkeypatch.setattr(fleet, "get_package_description", get_package_description)
+
+    repo_images = {"a": ["python:3.12"], "b": ["python:3.12", "nginx:1.25"]}
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = fleet.analyse_fleet(pool, repo_images, list(repo_images))
+
+    assert calls == {"base": 3, "sbom": 3, "description": 2}
+
+    images, package_descriptions = fleet.split_repo_results(repo_images["a"], [], results)
+    assert images == {"python:3.12", "debian:12"}
+    assert package_descriptions == {"deb": {("python3", "python3 description"), ("openssl", "openssl description")}}
+
+    images, _ = fleet.split_repo_results(repo_images["b"], [], results)
+    assert images == {"python:3.12", "nginx:1.25", "debian:12"}
+
+
+def test_run_fleet_skips_repo_that_fails_to_parse(monkeypatch, tmp_path):
+    good, bad = tmp_path / "good", tmp_path / "bad"
+    good.mkdir()
+    bad.mkdir()
+    (good / "Dockerfile").write_text("FROM python:3.12\n")
+    (bad / "docker-compose.yml").write_text("services: [unclosed\n")
+    stig_file = tmp_path / "stig.json"
+    stig_file.write_text(json.dumps({"technology_groups": []}))
+
+    monkeypatch.setattr(fleet, "get_base_image", lambda image: None)
+    monkeypatch.setattr(fleet, "get_image_info", lambda image: None)
+    monkeypatch.setattr(fleet, "scan_image", lambda image: [])
+    monkeypatch.setattr(fleet, "scan_project", lambda repo: [])
+
+    fleet.run_fleet([str(good), str(bad)], str(stig_file), workers=2)
+
+    assert (good / "data" / "used_stigs.json").exists()
+    assert not (bad / "data").exists()